@@ -3,10 +3,74 @@
 # Date: 2024/06/09
 # Description: Portfolio project of an implementation of a chess variant, Atomic Chess.
 
-from typing import List, Tuple
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Tuple
+
+# (start_pos, end_pos) in algebraic notation, e.g. ('e2', 'e4')
+Move = Tuple[str, str]
+# (move accepted, resulting game state, destroyed pieces as (square, piece))
+MoveOutcome = Tuple[bool, str, Tuple[Tuple[str, str], ...]]
+
+
+class PositionCache:
+    """ Bounded, thread-safe LRU cache for results derived from a board position """
+    def __init__(self, maxsize: int = 1024) -> None:
+        """ Initialize data members"""
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+        self._maxsize: int = maxsize
+        self._entries: "OrderedDict[Hashable, object]" = OrderedDict()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[object]:
+        """ Returns the cached value for key (marking it most recently used), or None on a miss """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: object) -> None:
+        """ Stores value under key, evicting the least recently used entry when full """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """ Removes all entries and resets the statistics """
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> Dict[str, float]:
+        """ Returns hits, misses, hit rate, current size and maxsize """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / lookups if lookups else 0.0,
+                'size': len(self._entries),
+                'maxsize': self._maxsize,
+            }
+
 
 class ChessVar:
     """ Represents a ChessVar implementation with methods based on atomic chess"""
+    # Process-global: shared by every game (keys hold the full position, so entries are valid for
+    # any instance), which also means cache_clear() from one game empties it for all of them
+    _position_cache: PositionCache = PositionCache()
+
     def __init__(self) -> None:
         """ Initialize data members"""
         self._board: List[List[str]] = [
@@ -150,6 +214,95 @@ class ChessVar:
 
         return True
 
+    def get_legal_moves(self) -> Tuple[Move, ...]:
+        """
+        Method to list every move make_move would accept in the current position
+        Returns: tuple of (start position, end position) pairs
+        """
+        key = (self._position_key(), 'moves')
+        cached = self._position_cache.get(key)
+        if cached is not None:
+            return cached
+
+        moves: List[Move] = []
+        if self._game_state == 'UNFINISHED':
+            for start_row in range(8):
+                for start_col in range(8):
+                    piece = self._board[start_row][start_col]
+                    if piece == '.':
+                        continue
+                    for end_row in range(8):
+                        for end_col in range(8):
+                            # Staying on the same square is not a move
+                            if (start_row, start_col) == (end_row, end_col):
+                                continue
+                            if not self.is_valid_move((start_row, start_col), (end_row, end_col)):
+                                continue
+                            # Same rule as make_move: a king may not capture the other king
+                            if piece.lower() == 'k' and self._board[end_row][end_col].lower() == 'k':
+                                continue
+                            moves.append((self.indices_to_pos((start_row, start_col)),
+                                          self.indices_to_pos((end_row, end_col))))
+
+        result = tuple(moves)
+        self._position_cache.put(key, result)
+        return result
+
+    def predict_move(self, start_pos: str, end_pos: str) -> MoveOutcome:
+        """
+        Method to predict the outcome of make_move without changing the game
+        Parameters: start position; end position
+        Returns: (True or False, resulting game state, pieces destroyed as (square, piece) pairs)
+        """
+        key = (self._position_key(), start_pos, end_pos)
+        cached = self._position_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Play the move on a scratch copy so the rules live only in make_move
+        scratch = ChessVar()
+        scratch._board = [row[:] for row in self._board]
+        scratch._current_turn = self._current_turn
+        scratch._game_state = self._game_state
+        success = scratch.make_move(start_pos, end_pos)
+
+        exploded: List[Tuple[str, str]] = []
+        end_row, end_col = self.pos_to_indices(end_pos)
+        if success and self._board[end_row][end_col] != '.':
+            # A capture happened, so every piece that disappeared was destroyed
+            for row in range(8):
+                for col in range(8):
+                    piece = self._board[row][col]
+                    if piece != '.' and scratch._board[row][col] == '.':
+                        exploded.append((self.indices_to_pos((row, col)), piece))
+
+        result: MoveOutcome = (success, scratch.get_game_state(), tuple(exploded))
+        self._position_cache.put(key, result)
+        return result
+
+    @classmethod
+    def cache_info(cls) -> Dict[str, float]:
+        """ Returns hit/miss statistics of the process-global position cache """
+        return cls._position_cache.info()
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """ Empties the process-global position cache (for every game) and resets its statistics """
+        cls._position_cache.clear()
+
+    def _position_key(self) -> Tuple[Tuple[str, ...], str, str]:
+        """
+        Method to build the cache key for the current position
+        The key is read from the board contents on every lookup, so direct edits to _board
+        never return stale results
+        """
+        return tuple(''.join(row) for row in self._board), self._current_turn, self._game_state
+
+    def indices_to_pos(self, indices: Tuple[int, int]) -> str:
+        """ Method to convert board indices back to algebraic notation"""
+        row, col = indices
+        return 'abcdefgh'[col] + str(8 - row)
+
     def pos_to_indices(self, pos: str) -> Tuple[int, int]:
         """ Method to determine the index to identify location on board"""
         col_letters = 'abcdefgh'
@@ -2,8 +2,16 @@
 """
 Interactive Atomic Chess Game
 Play a game of Atomic Chess in the terminal
+
+Batch mode (python3 play.py --batch [FILE]) replays moves from a file or stdin
+without prompts and reports throughput and per-move latency
 """
 
+import argparse
+import math
+import sys
+import time
+
 from ChessVar import ChessVar
 
 
@@ -38,17 +46,44 @@ def print_help():
     print()
 
 
-def print_board_with_labels(game):
-    """Print board with row and column labels"""
-    print("\n    a b c d e f g h")
-    print("  +-----------------+")
+def format_board_with_labels(game):
+    """Return board with row and column labels as a string"""
+    lines = ["", "    a b c d e f g h", "  +-----------------+"]
 
     for i, row in enumerate(game._board):
         row_num = 8 - i
-        print(f"{row_num} | {' '.join(row)} | {row_num}")
+        lines.append(f"{row_num} | {' '.join(row)} | {row_num}")
+
+    lines.append("  +-----------------+")
+    lines.append("    a b c d e f g h")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def print_board_with_labels(game):
+    """Print board with row and column labels"""
+    print(format_board_with_labels(game))
+
+
+def parse_move(move):
+    """Parse 'from_square to_square', returning (start, end) or an error message"""
+    parts = move.split()
+    if len(parts) != 2:
+        return "Invalid format. Use: 'from_square to_square' (e.g., 'e2 e4')"
 
-    print("  +-----------------+")
-    print("    a b c d e f g h\n")
+    start, end = parts
+
+    # Basic validation
+    if len(start) != 2 or len(end) != 2:
+        return "Invalid format. Squares should be 2 characters (e.g., 'e2')"
+
+    if start[0] not in 'abcdefgh' or end[0] not in 'abcdefgh':
+        return "Invalid column. Use letters a-h"
+
+    if start[1] not in '12345678' or end[1] not in '12345678':
+        return "Invalid row. Use numbers 1-8"
+
+    return start, end
 
 
 def get_move():
@@ -63,28 +98,12 @@ def get_move():
             print_help()
             continue
 
-        # Parse move
-        parts = move.split()
-        if len(parts) != 2:
-            print("Invalid format. Use: 'from_square to_square' (e.g., 'e2 e4')")
-            continue
-
-        start, end = parts
-
-        # Basic validation
-        if len(start) != 2 or len(end) != 2:
-            print("Invalid format. Squares should be 2 characters (e.g., 'e2')")
-            continue
-
-        if start[0] not in 'abcdefgh' or end[0] not in 'abcdefgh':
-            print("Invalid column. Use letters a-h")
-            continue
-
-        if start[1] not in '12345678' or end[1] not in '12345678':
-            print("Invalid row. Use numbers 1-8")
+        parsed = parse_move(move)
+        if isinstance(parsed, str):
+            print(parsed)
             continue
 
-        return start, end
+        return parsed
 
 
 def main():
@@ -141,7 +160,100 @@ def main():
     print("="*50 + "\n")
 
 
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(len(sorted_values) * pct / 100))
+    return sorted_values[rank - 1]
+
+
+# Report lines held back before writing, so output streams out without a write per move
+BATCH_FLUSH_LINES = 1000
+
+
+def run_batch(stream, out, show_board=False):
+    """
+    Replay moves from stream without prompts and write a report to out
+    One move per line ('e2 e4'); blank lines and '#' comments are skipped,
+    'new' starts a fresh game. Returns the number of malformed lines.
+    """
+    pending = []
+    latencies = []
+    game = ChessVar()
+    games = 1
+    accepted = rejected = malformed = 0
+
+    def emit(text):
+        pending.append(text)
+        if len(pending) >= BATCH_FLUSH_LINES:
+            out.write("\n".join(pending) + "\n")
+            pending.clear()
+
+    # Wall-clock time for the whole replay, including parsing, resets and rendering
+    replay_start = time.perf_counter()
+    for line_num, raw in enumerate(stream, 1):
+        move = raw.strip().lower()
+        if not move or move.startswith('#'):
+            continue
+
+        if move == 'new':
+            game = ChessVar()
+            games += 1
+            continue
+
+        parsed = parse_move(move)
+        if isinstance(parsed, str):
+            malformed += 1
+            emit(f"line {line_num}: {parsed}")
+            continue
+
+        start, end = parsed
+        began = time.perf_counter()
+        ok = game.make_move(start, end)
+        latencies.append(time.perf_counter() - began)
+
+        if ok:
+            accepted += 1
+            if game.get_game_state() != 'UNFINISHED':
+                emit(f"game {games}: {game.get_game_state()}")
+        else:
+            rejected += 1
+            emit(f"line {line_num}: invalid move {start} -> {end}")
+
+        if show_board:
+            emit(format_board_with_labels(game))
+    elapsed = time.perf_counter() - replay_start
+
+    latencies.sort()
+    emit(f"games: {games}  moves: {len(latencies)}  accepted: {accepted}  "
+         f"rejected: {rejected}  malformed: {malformed}")
+    emit(f"moves/sec: {len(latencies) / elapsed if elapsed else 0.0:.0f}")
+    emit("latency us: " + "  ".join(
+        f"p{pct}={percentile(latencies, pct) * 1e6:.1f}" for pct in (50, 90, 99)
+    ) + f"  max={(latencies[-1] if latencies else 0.0) * 1e6:.1f}")
+
+    out.write("\n".join(pending) + "\n")
+    out.flush()
+    return malformed
+
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Play Atomic Chess in the terminal")
+    parser.add_argument('--batch', nargs='?', const=sys.stdin, type=argparse.FileType('r'),
+                        metavar='FILE', help="replay moves from FILE (or stdin, also '-') without prompts")
+    parser.add_argument('--show-board', action='store_true',
+                        help="in batch mode, render the board after every move")
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
+    args = parse_args()
+    if args.batch is not None:
+        with args.batch:
+            sys.exit(1 if run_batch(args.batch, sys.stdout, args.show_board) else 0)
+
     try:
         main()
     except KeyboardInterrupt:
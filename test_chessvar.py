@@ -2,7 +2,7 @@
 # Author: Jomel Bautista
 
 import pytest
-from ChessVar import ChessVar
+from ChessVar import ChessVar, PositionCache
 
 
 class TestInitialization:
@@ -340,5 +340,99 @@ class TestEdgeCases:
                 assert 0 <= indices[1] < 8
 
 
+class TestPositionCache:
+    """Test cached legal move listing and move outcome prediction"""
+
+    def setup_method(self):
+        ChessVar.cache_clear()
+
+    def test_initial_legal_moves(self):
+        """Opening position lists the pawn pushes and knight jumps"""
+        game = ChessVar()
+        moves = game.get_legal_moves()
+        assert ('e2', 'e4') in moves
+        assert ('g1', 'f3') in moves
+        assert ('e7', 'e5') not in moves  # Black piece on white's turn
+        assert all(game.predict_move(start, end)[0] for start, end in moves)
+
+    def test_no_legal_moves_after_game_ends(self):
+        """Finished games have no legal moves"""
+        game = ChessVar()
+        game._game_state = 'WHITE_WON'
+        assert game.get_legal_moves() == ()
+
+    def test_repeated_query_hits_cache(self):
+        """Asking again for the same position should be served from the cache"""
+        game = ChessVar()
+        first = game.get_legal_moves()
+        assert ChessVar.cache_info()['misses'] == 1
+        assert ChessVar().get_legal_moves() == first
+        info = ChessVar.cache_info()
+        assert info['hits'] == 1
+        assert info['hit_rate'] == 0.5
+
+    def test_predict_move_does_not_change_game(self):
+        """Prediction should match make_move without touching the board"""
+        game = ChessVar()
+        game.make_move('d2', 'd4')
+        game.make_move('e7', 'e5')
+        before = [row[:] for row in game._board]
+        success, state, exploded = game.predict_move('d4', 'e5')
+        assert game._board == before
+        assert success == True
+        assert state == 'UNFINISHED'
+        assert ('d4', 'P') in exploded  # Capturing pawn is destroyed
+        assert ('e5', 'p') in exploded
+        assert game.make_move('d4', 'e5') == True
+
+    def test_predict_winning_move(self):
+        """Prediction should report the resulting game state"""
+        game = ChessVar()
+        game._board[0][4] = '.'
+        assert game.predict_move('e2', 'e4') == (True, 'WHITE_WON', ())
+        assert game.predict_move('e2', 'e5')[0] == False
+
+    def test_direct_board_mutation_is_not_stale(self):
+        """Editing _board directly must not return results for the old position"""
+        game = ChessVar()
+        assert ('e2', 'e4') in game.get_legal_moves()
+        game._board[6][4] = '.'
+        assert ('e2', 'e4') not in game.get_legal_moves()
+
+    def test_lru_eviction(self):
+        """Least recently used entry is evicted once the cache is full"""
+        cache = PositionCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert cache.info()['size'] == 2
+
+    def test_concurrent_access(self):
+        """Concurrent gets and puts with constant eviction should not raise"""
+        import threading
+        cache = PositionCache(maxsize=4)
+        errors = []
+
+        def worker():
+            try:
+                for i in range(2000):
+                    cache.put(i % 8, i)
+                    cache.get((i + 3) % 8)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+        info = cache.info()
+        assert info['hits'] + info['misses'] == 8000
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,114 @@
+# Unit tests for play.py batch mode
+# Author: Jomel Bautista
+
+import io
+
+import pytest
+import play
+from play import parse_move, percentile, run_batch
+
+
+def run(moves, show_board=False):
+    """Run batch mode on the given text and return (malformed count, output)"""
+    out = io.StringIO()
+    malformed = run_batch(io.StringIO(moves), out, show_board)
+    return malformed, out.getvalue()
+
+
+class TestParseMove:
+    """Test parsing of 'from_square to_square' input"""
+
+    def test_valid_move(self):
+        """Well formed move should return the two squares"""
+        assert parse_move('e2 e4') == ('e2', 'e4')
+
+    def test_invalid_moves_return_message(self):
+        """Malformed input should return an error message"""
+        assert isinstance(parse_move('e2'), str)
+        assert isinstance(parse_move('e22 e4'), str)
+        assert isinstance(parse_move('z2 e4'), str)
+        assert isinstance(parse_move('e9 e4'), str)
+
+
+class TestPercentile:
+    """Test nearest-rank percentile"""
+
+    def test_empty_list(self):
+        """Empty input should give 0.0"""
+        assert percentile([], 50) == 0.0
+
+    def test_known_values(self):
+        """Nearest rank on 1..10"""
+        values = list(range(1, 11))
+        assert percentile(values, 50) == 5
+        assert percentile(values, 90) == 9
+        assert percentile(values, 99) == 10
+        assert percentile(values, 0) == 1
+
+    def test_single_value(self):
+        """Single value is every percentile"""
+        assert percentile([7], 1) == 7
+        assert percentile([7], 100) == 7
+
+
+class TestRunBatch:
+    """Test non-interactive batch replay"""
+
+    def test_counts(self):
+        """Accepted, rejected and malformed moves should be counted"""
+        malformed, output = run('e2 e4\ne7 e5\ne2 e4\nzz\n')
+        assert malformed == 1
+        assert 'moves: 3  accepted: 2  rejected: 1  malformed: 1' in output
+        assert 'line 3: invalid move e2 -> e4' in output
+        assert 'line 4: Invalid format' in output
+
+    def test_skips_blank_lines_and_comments(self):
+        """Blank lines and '#' comments are not moves"""
+        malformed, output = run('# opening\n\n   \ne2 e4\n')
+        assert malformed == 0
+        assert 'moves: 1  accepted: 1  rejected: 0  malformed: 0' in output
+
+    def test_new_resets_game(self):
+        """'new' should start a fresh game so white can move again"""
+        malformed, output = run('e2 e4\nnew\ne2 e4\n')
+        assert 'games: 2  moves: 2  accepted: 2  rejected: 0' in output
+
+    def test_reports_game_result(self):
+        """Finished games should be reported"""
+        _, output = run('e2 e4\nf7 f6\nd1 h5\ng8 h6\nh5 e8\n')
+        assert 'game 1: WHITE_WON' in output
+
+    def test_return_value_drives_exit_code(self):
+        """Return value is the number of malformed lines"""
+        assert run('e2 e4\n')[0] == 0
+        assert run('bad\nalso bad\n')[0] == 2
+
+    def test_reports_throughput_and_latency(self):
+        """Summary should include moves/sec and latency percentiles"""
+        _, output = run('e2 e4\n')
+        assert 'moves/sec:' in output
+        assert 'p50=' in output and 'p99=' in output
+
+    def test_show_board(self):
+        """Board is only rendered when asked"""
+        assert 'a b c d e f g h' not in run('e2 e4\n')[1]
+        assert 'a b c d e f g h' in run('e2 e4\n', show_board=True)[1]
+
+    def test_output_streams_in_chunks(self, monkeypatch):
+        """Output should be written before the input ends"""
+        monkeypatch.setattr(play, 'BATCH_FLUSH_LINES', 2)
+
+        class Recorder(io.StringIO):
+            writes = 0
+
+            def write(self, text):
+                Recorder.writes += 1
+                return super().write(text)
+
+        out = Recorder()
+        run_batch(io.StringIO('x\n' * 6), out)
+        assert Recorder.writes > 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])